@@ -6,27 +6,37 @@ Builds Python projects with pyproject.toml into WASM modules.
 
 import argparse
 import compileall
+import hashlib
+import importlib.util
+import marshal
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
 import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
-# Try tomllib (Python 3.11+), fall back to tomli
+# Prefer the Rust-backed rtoml, then tomllib (Python 3.11+), then tomli
 try:
-    import tomllib
+    from rtoml import loads as toml_loads
 except ImportError:
     try:
-        import tomli as tomllib
+        from tomllib import loads as toml_loads
     except ImportError:
-        print("ERROR: tomllib not available.", file=sys.stderr)
-        sys.exit(1)
+        try:
+            from tomli import loads as toml_loads
+        except ImportError:
+            print("ERROR: no TOML parser available (install rtoml or tomli).", file=sys.stderr)
+            sys.exit(1)
 
 # Add extensions to path
 sys.path.insert(0, "/wadup")
 from extensions import (
+    EXTENSIONS,
     get_all_modules,
     get_all_libraries,
     get_all_python_dirs,
@@ -40,6 +50,26 @@ GUEST_DIR = Path("/wadup/guest/python")
 WASI_STUBS = Path("/wadup/wasi-stubs/python")
 WASI_SDK_PATH = Path(os.environ.get("WASI_SDK_PATH", "/opt/wasi-sdk"))
 OUTPUT_DIR = Path("/build/output")
+PYC_CACHE = Path(os.environ.get("WADUP_PYC_CACHE", "/build/.cache/pyc"))
+DEPS_CACHE = Path(os.environ.get("WADUP_DEPS_CACHE", "/build/.cache/deps"))
+
+# --bundle-compression choices: (zipfile method, compresslevel). deflated uses
+# the fastest level: .pyc compresses poorly, so higher levels cost far more
+# CPU than they save in bundle size
+BUNDLE_COMPRESSION = {
+    "stored": (zipfile.ZIP_STORED, None),
+    "deflated": (zipfile.ZIP_DEFLATED, 1),
+}
+
+# Directories and file types left out of bundle.zip: bytecode caches and
+# packaging metadata, plus type stubs, C/Cython sources and host-native
+# extension binaries, none of which the WASI interpreter can use
+BUNDLE_SKIP_DIRS = {"__pycache__"}
+BUNDLE_SKIP_DIR_SUFFIXES = (".dist-info", ".egg-info")
+BUNDLE_SKIP_SUFFIXES = (".pyi", ".so", ".pyd", ".dylib", ".c", ".h", ".pyx", ".pxd")
+
+# "// {{NAME}}" markers in main_bundled_template.c
+TEMPLATE_PLACEHOLDER = re.compile(r"// \{\{(\w+)\}\}")
 
 
 def print_info(msg: str) -> None:
@@ -54,12 +84,15 @@ def print_error(msg: str) -> None:
     print(f"[ERROR] {msg}", file=sys.stderr)
 
 
-def parse_pyproject(project_dir: Path) -> tuple[str, str, list[str]]:
-    """Parse pyproject.toml and return (name, entry_point, dependencies)."""
+def parse_pyproject(project_dir: Path) -> tuple[str, str, list[str], list[str] | None]:
+    """Parse pyproject.toml and return (name, entry_point, dependencies, extensions).
+
+    extensions is None when the project doesn't restrict which C extensions
+    are linked.
+    """
     pyproject_path = project_dir / "pyproject.toml"
 
-    with open(pyproject_path, 'rb') as f:
-        data = tomllib.load(f)
+    data = toml_loads(pyproject_path.read_text(encoding='utf-8'))
 
     project = data.get('project', {})
     wadup = data.get('tool', {}).get('wadup', {})
@@ -67,6 +100,7 @@ def parse_pyproject(project_dir: Path) -> tuple[str, str, list[str]]:
     name = project.get('name', '')
     entry_point = wadup.get('entry-point', '')
     dependencies = project.get('dependencies', [])
+    extensions = wadup.get('extensions')
 
     if not name:
         print_error("[project].name not found in pyproject.toml")
@@ -76,66 +110,301 @@ def parse_pyproject(project_dir: Path) -> tuple[str, str, list[str]]:
         # Default to module name with underscores
         entry_point = name.replace('-', '_')
 
-    return name, entry_point, dependencies
+    if extensions is not None:
+        unknown = sorted(set(extensions) - EXTENSIONS.keys())
+        if unknown:
+            print_error(f"Unknown [tool.wadup].extensions: {', '.join(unknown)} "
+                        f"(available: {', '.join(EXTENSIONS)})")
+            sys.exit(1)
+
+    return name, entry_point, dependencies, extensions
+
+
+def link_or_copy(src: str, dst: str) -> str:
+    """Hardlink src to dst, falling back to a copy (e.g. across filesystems).
+
+    The bundle directory is thrown away after zipping, so a hardlink gives
+    the same result as a copy without moving any file data.
+    """
+    # Never write through an existing destination: it may itself be a
+    # hardlink to one of the original files
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def copy_paths(copies: list[tuple[Path, Path]], merge: bool = False) -> None:
+    """Copy (src, dst) pairs concurrently.
+
+    Directories are copied with copytree, files individually; file data is
+    hardlinked where possible. With merge=True, directory trees are merged
+    into existing destinations instead of failing when the destination
+    already exists. If several pairs share a destination, the last one
+    wins, as it would when copying in order.
+    """
+    def copy_one(src: Path, dst: Path) -> None:
+        if src.is_dir():
+            shutil.copytree(src, dst, copy_function=link_or_copy, dirs_exist_ok=merge)
+        else:
+            link_or_copy(src, dst)
+
+    # Copying is IO-bound, so threads overlap well despite the GIL
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # Two workers must never write the same destination
+        unique = {dst: src for src, dst in copies}
+        futures = [pool.submit(copy_one, src, dst) for dst, src in unique.items()]
+        for future in futures:
+            future.result()
+
+
+def install_dependencies(dependencies: list[str]) -> Path | None:
+    """Install pure-Python dependencies, reusing an earlier install of the same set.
+
+    Installs are cached under DEPS_CACHE keyed on the Python version and the
+    dependency specifiers, so unpinned dependencies keep the versions they
+    first resolved to until the cache is cleared. Returns None on failure.
+    """
+    key = hashlib.sha256(
+        "\n".join([sys.version, *sorted(dependencies)]).encode()
+    ).hexdigest()[:16]
+    deps_dir = DEPS_CACHE / key
+    if deps_dir.is_dir():
+        print_info(f"Using cached dependencies ({key})")
+        return deps_dir
+
+    print_info(f"Installing dependencies: {dependencies}")
+    DEPS_CACHE.mkdir(parents=True, exist_ok=True)
+    install_dir = Path(tempfile.mkdtemp(prefix=f"{key}.", dir=DEPS_CACHE))
+    # Prefer uv, which resolves and unpacks wheels much faster than pip
+    uv = shutil.which("uv")
+    if uv:
+        pip_cmd = [uv, "pip", "install", "--python", sys.executable]
+    else:
+        pip_cmd = [sys.executable, "-m", "pip", "install"]
+    pip_cmd += [
+        "--target", str(install_dir),
+        "--quiet",
+        *dependencies
+    ]
+    result = subprocess.run(pip_cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        shutil.rmtree(install_dir, ignore_errors=True)
+        print_error(f"Failed to install dependencies: {result.stderr}")
+        return None
+
+    # Publish the finished install; if a concurrent build got there first,
+    # use its copy
+    try:
+        install_dir.rename(deps_dir)
+    except OSError:
+        shutil.rmtree(install_dir, ignore_errors=True)
+    return deps_dir
+
+
+def compile_source(path: str, arcname: str) -> bool:
+    """Compile one bundled source to a legacy .pyc next to it.
+
+    The code object is named after the file's path inside the bundle rather
+    than the temporary build directory, so the .pyc is reusable across builds.
+    """
+    return bool(compileall.compile_file(
+        path, ddir=os.path.dirname(arcname), force=True, quiet=1, legacy=True,
+    ))
+
+
+def read_bundle_file(entry: tuple[str, str]) -> tuple[zipfile.ZipInfo, bytes]:
+    """Read a bundle file into memory along with its zip entry header."""
+    file_path, arcname = entry
+    with open(file_path, 'rb') as f:
+        return zipfile.ZipInfo.from_file(file_path, arcname), f.read()
+
+
+def read_cached_pyc(cache_file: Path) -> bytes | None:
+    """Read a cached .pyc, or None if it is missing or not a complete .pyc.
+
+    The cache volume is shared by concurrent builds and never invalidated,
+    so an entry is only trusted if it has the current magic number and its
+    code object unmarshals.
+    """
+    try:
+        data = cache_file.read_bytes()
+    except OSError:
+        return None
+    if len(data) < 16 or data[:4] != importlib.util.MAGIC_NUMBER:
+        return None
+    try:
+        marshal.loads(data[16:])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return data
+
 
+def store_cached_pyc(pyc_file: str, cache_file: Path) -> None:
+    """Publish a compiled .pyc into the cache atomically.
 
-def generate_main_bundled_c(template_path: Path, output_path: Path) -> None:
+    The data is written to a unique temp file next to the entry and renamed
+    into place, so a concurrent build (possibly in another container sharing
+    the volume) never sees a partial file.
+    """
+    with open(pyc_file, 'rb') as f:
+        data = f.read()
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(prefix=cache_file.name, suffix='.tmp', dir=cache_file.parent)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+
+
+def map_bounded(pool: ThreadPoolExecutor, fn, items, window: int):
+    """Like pool.map(fn, items), but with at most window calls in flight.
+
+    Executor.map submits every call up front, so results the consumer
+    hasn't reached yet pile up in memory.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def compile_bundle(bundle_dir: Path) -> tuple[int, int]:
+    """Compile all .py files in the bundle, reusing cached .pyc files.
+
+    Compiled files are kept in PYC_CACHE keyed by the bytecode magic number,
+    the file's path in the bundle and its contents. Sources that don't change
+    between builds (extension packages, stubs, pinned dependencies) are
+    written out from the cache instead of being recompiled.
+
+    Returns (cached, compiled) file counts.
+    """
+    cached = 0
+    misses = []
+    for root, _dirs, files in os.walk(bundle_dir):
+        for name in files:
+            if not name.endswith('.py'):
+                continue
+            path = os.path.join(root, name)
+            arcname = os.path.relpath(path, bundle_dir)
+            with open(path, 'rb') as f:
+                key = hashlib.sha1(importlib.util.MAGIC_NUMBER + arcname.encode() + b'\0' + f.read()).hexdigest()
+            cache_file = PYC_CACHE / key[:2] / f"{key}.pyc"
+            data = read_cached_pyc(cache_file)
+            if data is not None:
+                with open(path + 'c', 'wb') as f:
+                    f.write(data)
+                cached += 1
+            else:
+                misses.append((path, arcname, cache_file))
+
+    if not misses:
+        return cached, 0
+
+    with ProcessPoolExecutor() as pool:
+        results = list(pool.map(
+            compile_source,
+            [path for path, _, _ in misses],
+            [arcname for _, arcname, _ in misses],
+            chunksize=16,
+        ))
+
+    # Store new .pyc files; the cache is best-effort, so failures are ignored
+    for (path, _, cache_file), ok in zip(misses, results):
+        if not ok:
+            continue
+        try:
+            store_cached_pyc(path + 'c', cache_file)
+        except OSError:
+            pass
+
+    return cached, len(misses)
+
+
+def generate_main_bundled_c(template_path: Path, output_path: Path, extensions: list[str] | None) -> None:
     """Generate main_bundled.c from template with extension registrations."""
     with open(template_path, 'r') as f:
         template = f.read()
 
-    # Get all modules to register (lxml + pydantic)
-    modules = get_all_modules()
+    # Get all modules to register
+    modules = get_all_modules(extensions)
 
     # Generate extern declarations
-    extern_lines = []
-    for module_name, init_func in modules:
-        extern_lines.append(f"extern PyObject* {init_func}(void);")
-    extern_declarations = "\n".join(extern_lines)
+    extern_declarations = "\n".join(
+        f"extern PyObject* {init_func}(void);" for _, init_func in modules
+    )
 
     # Generate registration code
-    register_lines = []
-    for module_name, init_func in modules:
-        register_lines.append(f'    if (PyImport_AppendInittab("{module_name}", {init_func}) == -1) {{')
-        register_lines.append(f'        fprintf(stderr, "Failed to register {module_name}\\n");')
-        register_lines.append('        return 1;')
-        register_lines.append('    }')
-    register_extensions = "\n".join(register_lines)
-
-    # Replace placeholders
-    output = template.replace("// {{EXTERN_DECLARATIONS}}", extern_declarations)
-    output = output.replace("// {{REGISTER_EXTENSIONS}}", register_extensions)
+    register_extensions = "\n".join(
+        f'    if (PyImport_AppendInittab("{module_name}", {init_func}) == -1) {{\n'
+        f'        fprintf(stderr, "Failed to register {module_name}\\n");\n'
+        '        return 1;\n'
+        '    }'
+        for module_name, init_func in modules
+    )
+
+    # Replace all placeholders in a single pass over the template
+    substitutions = {
+        "EXTERN_DECLARATIONS": extern_declarations,
+        "REGISTER_EXTENSIONS": register_extensions,
+    }
+    output = TEMPLATE_PLACEHOLDER.sub(lambda m: substitutions[m.group(1)], template)
 
     with open(output_path, 'w') as f:
         f.write(output)
 
 
-def generate_bundle_header(bundle_zip: Path, entry_module: str, output_path: Path) -> int:
-    """Generate bundle.h with embedded zip data. Returns bundle size."""
-    with open(bundle_zip, 'rb') as f:
-        data = f.read()
+def generate_bundle_asm(bundle_zip: Path, output_path: Path) -> int:
+    """Generate bundle.s which embeds the zip file via .incbin. Returns bundle size.
 
-    with open(output_path, 'w') as f:
-        f.write('// Auto-generated bundle header\n')
-        f.write('// Contains embedded Python modules as a zip file\n\n')
-        f.write(f'#define ENTRY_MODULE "{entry_module}"\n\n')
-        f.write(f'static const size_t BUNDLE_SIZE = {len(data)};\n\n')
-        f.write('static const unsigned char BUNDLE_DATA[] = {\n')
-
-        # Write bytes in rows of 16
-        for i in range(0, len(data), 16):
-            chunk = data[i:i+16]
-            hex_vals = ', '.join(f'0x{b:02x}' for b in chunk)
-            f.write(f'    {hex_vals},\n')
-
-        f.write('};\n')
+    The assembler copies the file straight into a data segment, so the
+    bundle never goes through the C front end as a hex initializer. The
+    symbols follow the naming used by `ld -b binary`.
+    """
+    bundle_size = bundle_zip.stat().st_size
 
-    return len(data)
+    with open(output_path, 'w') as f:
+        f.write('# Auto-generated bundle object\n')
+        f.write('# Contains embedded Python modules as a zip file\n\n')
+        f.write('\t.section .rodata._binary_bundle_zip,"",@\n')
+        f.write('\t.globl _binary_bundle_zip_start\n')
+        f.write('\t.type _binary_bundle_zip_start,@object\n')
+        f.write('_binary_bundle_zip_start:\n')
+        f.write(f'\t.incbin "{bundle_zip}"\n')
+        f.write(f'\t.size _binary_bundle_zip_start, {bundle_size}\n\n')
+        f.write('\t.globl _binary_bundle_zip_end\n')
+        f.write('\t.type _binary_bundle_zip_end,@object\n')
+        f.write('_binary_bundle_zip_end:\n')
+        f.write('\t.size _binary_bundle_zip_end, 0\n')
+
+    return bundle_size
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Build a Python WADUP module")
     parser.add_argument("project_dir", help="Path to the project directory")
+    parser.add_argument(
+        "--bundle-compression",
+        choices=BUNDLE_COMPRESSION,
+        default=os.environ.get("WADUP_BUNDLE_COMPRESSION", "deflated"),
+        help="How to store files in the embedded bundle.zip: 'stored' skips "
+             "compression for faster builds and imports at the cost of a "
+             "larger module (default: deflated, or $WADUP_BUNDLE_COMPRESSION)",
+    )
     args = parser.parse_args()
 
     project_dir = Path(args.project_dir).resolve()
@@ -150,10 +419,11 @@ def main() -> int:
 
     # Parse pyproject.toml
     print_info("Parsing pyproject.toml...")
-    project_name, entry_module, dependencies = parse_pyproject(project_dir)
+    project_name, entry_module, dependencies, extensions = parse_pyproject(project_dir)
 
     print_success(f"Project: {project_name}")
     print_success(f"Entry point: {entry_module}")
+    print_success(f"C extensions: {', '.join(extensions if extensions is not None else EXTENSIONS)}")
 
     # Convert project name to WASM filename (hyphens to underscores)
     wasm_name = project_name.replace('-', '_')
@@ -169,131 +439,152 @@ def main() -> int:
         bundle_dir = build_dir / "bundle"
         bundle_dir.mkdir()
 
+        # Collect everything to bundle first, then copy it concurrently
+        copies = []
+
         # Copy wadup library
         print_info("Bundling wadup library...")
-        shutil.copytree(GUEST_DIR / "wadup", bundle_dir / "wadup")
+        copies.append((GUEST_DIR / "wadup", bundle_dir / "wadup"))
 
         # Copy project source - try both src/ layout and flat layout
         print_info("Bundling project source...")
         source_dir = project_dir / "src" / entry_module
         if source_dir.is_dir():
-            shutil.copytree(source_dir, bundle_dir / entry_module)
+            copies.append((source_dir, bundle_dir / entry_module))
         elif (project_dir / entry_module).is_dir():
-            shutil.copytree(project_dir / entry_module, bundle_dir / entry_module)
+            copies.append((project_dir / entry_module, bundle_dir / entry_module))
         else:
             print_error(f"Source directory not found: {source_dir}")
             return 1
 
         # Install pure Python dependencies if any
         if dependencies:
-            print_info(f"Installing dependencies: {dependencies}")
-            deps_dir = build_dir / "pip_deps"
-            deps_dir.mkdir()
-            pip_cmd = [
-                sys.executable, "-m", "pip", "install",
-                "--target", str(deps_dir),
-                "--quiet",
-                *dependencies
-            ]
-            result = subprocess.run(pip_cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                print_error(f"Failed to install dependencies: {result.stderr}")
+            deps_dir = install_dependencies(dependencies)
+            if deps_dir is None:
                 return 1
 
             # Bundle installed packages (skip metadata directories)
-            for item in deps_dir.iterdir():
-                if item.is_dir() and not item.name.endswith('.dist-info') and not item.name.endswith('.egg-info'):
-                    dest = bundle_dir / item.name
-                    if not dest.exists():
-                        print_info(f"Bundling dependency: {item.name}")
-                        shutil.copytree(item, dest)
-                elif item.is_file() and item.suffix == '.py':
-                    dest = bundle_dir / item.name
-                    if not dest.exists():
-                        print_info(f"Bundling dependency file: {item.name}")
-                        shutil.copy(item, dest)
-
-        # Bundle C extension Python files (lxml + pydantic always included)
-        ext_python_dirs = get_all_python_dirs()
+            bundled = {dst.name for _, dst in copies}
+            # scandir's cached entry types avoid a stat per item
+            with os.scandir(deps_dir) as entries:
+                for entry in entries:
+                    if entry.name in bundled:
+                        continue
+                    # bin/ holds console scripts, which can't run inside WADUP
+                    if entry.is_dir() and entry.name != 'bin' and not entry.name.endswith(('.dist-info', '.egg-info')):
+                        print_info(f"Bundling dependency: {entry.name}")
+                        copies.append((Path(entry.path), bundle_dir / entry.name))
+                    elif entry.is_file() and entry.name.endswith('.py'):
+                        print_info(f"Bundling dependency file: {entry.name}")
+                        copies.append((Path(entry.path), bundle_dir / entry.name))
+
+        # Bundle C extension Python files
+        ext_python_dirs = get_all_python_dirs(extensions)
         for ext_python_dir in ext_python_dirs:
             src_path = DEPS_DIR / ext_python_dir
             pkg_name = src_path.name
             if src_path.exists():
                 print_info(f"Bundling {pkg_name} Python files...")
-                shutil.copytree(src_path, bundle_dir / pkg_name)
+                copies.append((src_path, bundle_dir / pkg_name))
 
         # Copy single-file Python modules
-        ext_python_files = get_all_python_files()
+        ext_python_files = get_all_python_files(extensions)
         for ext_python_file in ext_python_files:
             src_path = DEPS_DIR / ext_python_file
             if src_path.exists():
                 print_info(f"Bundling {src_path.name}...")
-                shutil.copy(src_path, bundle_dir / src_path.name)
+                copies.append((src_path, bundle_dir / src_path.name))
+
+        copy_paths(copies)
 
-        # Copy WASI Python stubs
+        # Copy WASI Python stubs, merging stub packages over bundled ones.
+        # Stub directories without an __init__.py only patch submodules of
+        # a real package, so they are skipped when that package isn't
+        # bundled (e.g. an extension the project didn't select).
         if WASI_STUBS.is_dir():
-            for stub_file in WASI_STUBS.glob("*.py"):
-                shutil.copy(stub_file, bundle_dir / stub_file.name)
-            for stub_pkg in WASI_STUBS.iterdir():
-                if stub_pkg.is_dir():
-                    dest_pkg = bundle_dir / stub_pkg.name
-                    if dest_pkg.exists():
-                        for item in stub_pkg.rglob('*'):
-                            if item.is_file():
-                                rel_path = item.relative_to(stub_pkg)
-                                dest_file = dest_pkg / rel_path
-                                dest_file.parent.mkdir(parents=True, exist_ok=True)
-                                shutil.copy(item, dest_file)
-                    else:
-                        shutil.copytree(stub_pkg, dest_pkg)
+            with os.scandir(WASI_STUBS) as entries:
+                stub_copies = [
+                    (Path(stub.path), bundle_dir / stub.name)
+                    for stub in entries
+                    if (stub.is_dir() and (os.path.exists(os.path.join(stub.path, "__init__.py"))
+                                           or (bundle_dir / stub.name).is_dir()))
+                    or stub.name.endswith('.py')
+                ]
+            copy_paths(stub_copies, merge=True)
 
         # Pre-compile all Python files to .pyc
         print_info("Pre-compiling Python files...")
-        compileall.compile_dir(bundle_dir, force=True, quiet=1, legacy=True)
-
-        # Count compiled files
-        pyc_count = len(list(bundle_dir.rglob('*.pyc')))
+        cached, compiled = compile_bundle(bundle_dir)
+        print_info(f"Reused {cached} cached .pyc files, compiled {compiled}")
+
+        # Walk the bundle once: count compiled files and collect the files for
+        # the zip, leaving out .py files that have a .pyc sibling (forcing
+        # Python to use the .pyc) and anything the interpreter can't use.
+        # The sources stay on disk; the build directory is thrown away anyway.
+        print_info("Collecting bundle files (keeping only .pyc)...")
+        pyc_count = 0
+        py_skipped = 0
+        other_skipped = 0
+        bundle_files = []
+        for root, dirs, files in os.walk(bundle_dir):
+            dirs[:] = [
+                d for d in dirs
+                if d not in BUNDLE_SKIP_DIRS and not d.endswith(BUNDLE_SKIP_DIR_SUFFIXES)
+            ]
+            file_set = set(files)
+            for name in files:
+                file_path = os.path.join(root, name)
+                if name.endswith('.py') and name + 'c' in file_set:
+                    py_skipped += 1
+                    continue
+                if name.endswith(BUNDLE_SKIP_SUFFIXES):
+                    other_skipped += 1
+                    continue
+                if name.endswith('.pyc'):
+                    pyc_count += 1
+                bundle_files.append((file_path, os.path.relpath(file_path, bundle_dir)))
         print_success(f"Pre-compiled {pyc_count} Python files")
-
-        # Remove .py files to force Python to use .pyc files
-        print_info("Removing .py source files (keeping only .pyc)...")
-        py_removed = 0
-        for py_file in list(bundle_dir.rglob('*.py')):
-            pyc_file = py_file.with_suffix('.pyc')
-            if pyc_file.exists():
-                py_file.unlink()
-                py_removed += 1
-        print_success(f"Removed {py_removed} .py files")
+        print_success(f"Left out {py_skipped} .py files and {other_skipped} unusable files")
 
         # Create zip bundle
-        print_info("Creating bundle.zip...")
+        print_info(f"Creating bundle.zip ({args.bundle_compression})...")
         bundle_zip = build_dir / "bundle.zip"
-        with zipfile.ZipFile(bundle_zip, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for file_path in bundle_dir.rglob('*'):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(bundle_dir)
-                    zf.write(file_path, arcname)
+        compression, compresslevel = BUNDLE_COMPRESSION[args.bundle_compression]
+        # Files are read on a few threads while this one compresses and writes
+        # them in order (a zip file only supports a single writer). Read-ahead
+        # is bounded so only a few files are held in memory at once.
+        read_workers = 4
+        with zipfile.ZipFile(bundle_zip, 'w') as zf, ThreadPoolExecutor(max_workers=read_workers) as pool:
+            for zinfo, data in map_bounded(pool, read_bundle_file, bundle_files, 2 * read_workers):
+                zf.writestr(zinfo, data, compression, compresslevel)
 
         bundle_size = bundle_zip.stat().st_size
         print_success(f"Bundle size: {bundle_size} bytes")
 
-        # Generate bundle.h
-        print_info("Generating bundle.h...")
-        bundle_h = build_dir / "bundle.h"
-        generate_bundle_header(bundle_zip, entry_module, bundle_h)
+        # Generate bundle.s
+        print_info("Generating bundle.s...")
+        bundle_s = build_dir / "bundle.s"
+        generate_bundle_asm(bundle_zip, bundle_s)
 
         # Compile
         print_info("Compiling...")
         cc = WASI_SDK_PATH / "bin" / "clang"
         wasi_sysroot = WASI_SDK_PATH / "share" / "wasi-sysroot"
 
+        # Assemble the bundle into its own object file. This is never run
+        # through ccache, which can't see the .incbin dependency.
+        asm_cmd = [str(cc), "-c", str(bundle_s), "-o", str(build_dir / "bundle.o")]
+        result = subprocess.run(asm_cmd, cwd=build_dir)
+        if result.returncode != 0:
+            print_error("Assembling bundle failed")
+            return 1
+
         cflags = [
             "-O2",
             "-D_WASI_EMULATED_SIGNAL",
             "-D_WASI_EMULATED_GETPID",
             "-D_WASI_EMULATED_PROCESS_CLOCKS",
             f"-I{PYTHON_DIR}/include",
-            f"-I{build_dir}",
             "-fvisibility=default"
         ]
         ldflags = [
@@ -310,11 +601,21 @@ def main() -> int:
         # Generate main_bundled.c from template
         main_c_template = GUEST_DIR / "src" / "main_bundled_template.c"
         main_c_dst = build_dir / "main_bundled.c"
-        generate_main_bundled_c(main_c_template, main_c_dst)
-
-        # Compile object file
-        compile_cmd = [str(cc)] + cflags + ["-c", str(main_c_dst), "-o", str(build_dir / "main_bundled.o")]
-        result = subprocess.run(compile_cmd, cwd=build_dir)
+        generate_main_bundled_c(main_c_template, main_c_dst, extensions)
+
+        # Compile object file. The entry module is passed as a define, so
+        # main_bundled.c depends only on the selected extensions: projects
+        # with the same extension set share it, and ccache (with paths made
+        # relative to the build directory) turns this into a cache hit.
+        compile_cmd = [str(cc)] + cflags + [
+            f'-DENTRY_MODULE="{entry_module}"',
+            "-c", str(main_c_dst), "-o", str(build_dir / "main_bundled.o"),
+        ]
+        ccache = shutil.which("ccache")
+        if ccache:
+            compile_cmd.insert(0, ccache)
+        compile_env = {**os.environ, "CCACHE_BASEDIR": str(build_dir)}
+        result = subprocess.run(compile_cmd, cwd=build_dir, env=compile_env)
         if result.returncode != 0:
             print_error("Compilation failed")
             return 1
@@ -322,9 +623,9 @@ def main() -> int:
         # Find Hacl library files
         hacl_libs = list((PYTHON_DIR / "lib").glob("libHacl_*.a"))
 
-        # Build list of C extension libraries (lxml + pydantic always included)
+        # Build list of C extension libraries
         ext_libs = []
-        ext_lib_paths = get_all_libraries()
+        ext_lib_paths = get_all_libraries(extensions)
         for lib_path in ext_lib_paths:
             full_path = DEPS_DIR / lib_path
             if full_path.exists():
@@ -335,6 +636,7 @@ def main() -> int:
             str(cc),
             *cflags,
             str(build_dir / "main_bundled.o"),
+            str(build_dir / "bundle.o"),
             "-o", str(build_dir / "module.wasm"),
             f"-L{PYTHON_DIR}/lib",
             f"-lpython{python_version}",
@@ -1,90 +1,130 @@
 """C extension registry for WADUP Python builds.
 
-lxml and pydantic are always included in all Python WASM modules.
+lxml and pydantic are included in Python WASM modules by default. A project
+can link only the extensions it uses by listing them under [tool.wadup]:
+
+    [tool.wadup]
+    extensions = ["lxml"]
+
+Each get_* function takes that list (None selects every extension) and
+returns a cached tuple.
 """
 
-# Extensions always included in Python builds
-EXTENSIONS = {
-    "pydantic": {
-        "modules": [
+import functools
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ExtensionSpec:
+    """A pre-built C extension and the files a build needs from it.
+
+    Paths are relative to the deps directory in the build image.
+    """
+    # (module name, init function) pairs to register as built-ins
+    modules: tuple[tuple[str, str], ...]
+    # Static libraries to link
+    libraries: tuple[str, ...]
+    # Python packages to bundle
+    python_dirs: tuple[str, ...] = ()
+    # Single-file Python modules (not packages) to bundle
+    python_files: tuple[str, ...] = ()
+    # Files that must exist to confirm the extension is built
+    validation: tuple[str, ...] = ()
+
+
+# Extensions available to Python builds
+EXTENSIONS: dict[str, ExtensionSpec] = {
+    "pydantic": ExtensionSpec(
+        modules=(
             # The core Rust extension
             ("_pydantic_core", "PyInit__pydantic_core"),
-        ],
-        "libraries": [
+        ),
+        libraries=(
             "wasi-pydantic/lib/lib_pydantic_core.a",
-        ],
-        "python_dirs": [
+        ),
+        python_dirs=(
             "wasi-pydantic/python/pydantic_core",
             "wasi-pydantic/python/pydantic",
             "wasi-pydantic/python/annotated_types",
             "wasi-pydantic/python/typing_inspection",
-        ],
-        "python_files": [
-            # Single-file modules (not packages)
+        ),
+        python_files=(
             "wasi-pydantic/python/typing_extensions.py",
-        ],
-        "validation": [
+        ),
+        validation=(
             "wasi-pydantic/lib/lib_pydantic_core.a",
-        ],
-    },
+        ),
+    ),
 
-    "lxml": {
-        "modules": [
+    "lxml": ExtensionSpec(
+        modules=(
             ("lxml.etree", "PyInit_etree"),
-        ],
-        "libraries": [
+        ),
+        libraries=(
             "wasi-lxml/lib/liblxml_etree.a",
             "wasi-libxslt/lib/libexslt.a",
             "wasi-libxslt/lib/libxslt.a",
             "wasi-libxml2/lib/libxml2.a",
-        ],
-        "python_dirs": [
+        ),
+        python_dirs=(
             "wasi-lxml/python/lxml",
-        ],
-        "validation": [
+        ),
+        validation=(
             "wasi-lxml/lib/liblxml_etree.a",
             "wasi-libxml2/lib/libxml2.a",
             "wasi-libxslt/lib/libxslt.a",
-        ],
-    },
+        ),
+    ),
 }
 
 
-def get_all_modules() -> list[tuple[str, str]]:
+@functools.lru_cache(maxsize=None)
+def _resolve(names: frozenset[str] | None) -> tuple[ExtensionSpec, ...]:
+    """Resolve a set of extension names to registry entries, in registry order."""
+    if names is None:
+        return tuple(EXTENSIONS.values())
+    unknown = names - EXTENSIONS.keys()
+    if unknown:
+        raise ValueError(f"Unknown extensions: {', '.join(sorted(unknown))}")
+    return tuple(ext for name, ext in EXTENSIONS.items() if name in names)
+
+
+@functools.lru_cache(maxsize=None)
+def _collect(field: str, names: frozenset[str] | None) -> tuple:
+    """Concatenate one registry field across the selected extensions."""
+    return tuple(item for ext in _resolve(names) for item in getattr(ext, field))
+
+
+def _get(field: str, names) -> tuple:
+    return _collect(field, None if names is None else frozenset(names))
+
+
+def clear_cache() -> None:
+    """Forget resolved selections (needed only if EXTENSIONS is modified)."""
+    _resolve.cache_clear()
+    _collect.cache_clear()
+
+
+def get_all_modules(names=None) -> tuple[tuple[str, str], ...]:
     """Get all C extension modules to register."""
-    modules = []
-    for ext in EXTENSIONS.values():
-        modules.extend(ext.get("modules", []))
-    return modules
+    return _get("modules", names)
 
 
-def get_all_libraries() -> list[str]:
+def get_all_libraries(names=None) -> tuple[str, ...]:
     """Get all library paths to link."""
-    libraries = []
-    for ext in EXTENSIONS.values():
-        libraries.extend(ext.get("libraries", []))
-    return libraries
+    return _get("libraries", names)
 
 
-def get_all_python_dirs() -> list[str]:
+def get_all_python_dirs(names=None) -> tuple[str, ...]:
     """Get all Python directories to bundle."""
-    dirs = []
-    for ext in EXTENSIONS.values():
-        dirs.extend(ext.get("python_dirs", []))
-    return dirs
+    return _get("python_dirs", names)
 
 
-def get_all_python_files() -> list[str]:
+def get_all_python_files(names=None) -> tuple[str, ...]:
     """Get all Python single-file modules to bundle."""
-    files = []
-    for ext in EXTENSIONS.values():
-        files.extend(ext.get("python_files", []))
-    return files
+    return _get("python_files", names)
 
 
-def get_validation_files() -> list[str]:
+def get_validation_files(names=None) -> tuple[str, ...]:
     """Get all files that must exist to confirm extensions are built."""
-    files = []
-    for ext in EXTENSIONS.values():
-        files.extend(ext.get("validation", []))
-    return files
+    return _get("validation", names)
@@ -48,6 +48,9 @@ class parserinfo:
 
     PERTAIN = ["of"]
 
+    # Lower-case month name or abbreviation -> month number
+    MONTH_MAP = {m.lower(): i + 1 for i, names in enumerate(MONTHS) for m in names}
+
     def __init__(self, dayfirst=False, yearfirst=False):
         self.dayfirst = dayfirst
         self.yearfirst = yearfirst
@@ -58,11 +61,24 @@ class ParserError(ValueError):
     pass
 
 
+def _fromisoformat(timestr):
+    """datetime.fromisoformat, also accepting 'Z' for UTC everywhere."""
+    # Python 3.11+ takes the 'Z' as is, so try the string unchanged first.
+    # Older versions, and date-only input such as '2024-01-05Z' on any
+    # version, need it spelled out as an offset.
+    try:
+        return datetime.datetime.fromisoformat(timestr)
+    except ValueError:
+        if 'Z' not in timestr:
+            raise
+    return datetime.datetime.fromisoformat(timestr.replace('Z', '+00:00'))
+
+
 def _parse_isoformat(timestr):
     """Try to parse ISO format dates."""
     # Try datetime.fromisoformat first (Python 3.7+)
     try:
-        return datetime.datetime.fromisoformat(timestr.replace('Z', '+00:00'))
+        return _fromisoformat(timestr)
     except ValueError:
         pass
 
@@ -78,25 +94,97 @@ def _parse_isoformat(timestr):
     return None
 
 
+# Formats tried in order by the slow path
+_COMMON_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%Y%m%d",
+    "%d-%b-%Y",
+    "%d %b %Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+)
+
+# Canonical spellings of the formats above (ASCII digits, zero-padded
+# numeric fields, single separators), matched in one pass instead of trying
+# each strptime format and catching its ValueError. Anything else goes
+# through strptime, which also accepts unpadded fields, runs of whitespace
+# and non-ASCII digits.
+_COMMON_FORMAT_RE = re.compile(r"""
+    # %Y-%m-%d [%H:%M:%S[.%f]]
+      (?P<Y>[0-9]{4})-(?P<m>[0-9]{2})-(?P<d>[0-9]{2})
+      (?:\ (?P<H>[0-9]{2}):(?P<M>[0-9]{2}):(?P<S>[0-9]{2})(?:\.(?P<f>[0-9]{1,6}))?)?
+    # %Y/%m/%d
+    | (?P<sY>[0-9]{4})/(?P<sm>[0-9]{2})/(?P<sd>[0-9]{2})
+    # %Y%m%d
+    | (?P<cY>[0-9]{4})(?P<cm>[0-9]{2})(?P<cd>[0-9]{2})
+    # %d/%m/%Y, then %m/%d/%Y
+    | (?P<a>[0-9]{2})/(?P<b>[0-9]{2})/(?P<aY>[0-9]{4})
+    # %d-%b-%Y and %d %b %Y
+    | (?P<td>[0-9]{1,2})(?P<tsep>[-\ ])(?P<tb>[A-Za-z]{3})(?P=tsep)(?P<tY>[0-9]{4})
+    # %b %d, %Y and %B %d, %Y
+    | (?P<bb>[A-Za-z]+)\ (?P<bd>[0-9]{1,2}),\ (?P<bY>[0-9]{4})
+""", re.VERBOSE)
+
+# %b only accepts abbreviations; %B (and so MONTH_MAP) also full names
+_MONTH_ABBR_MAP = {abbr.lower(): i + 1 for i, (abbr, _) in enumerate(parserinfo.MONTHS)}
+
+
+def _match_common_format(timestr):
+    """Parse a canonical common-format string, or return None."""
+    mo = _COMMON_FORMAT_RE.fullmatch(timestr)
+    if mo is None:
+        return None
+
+    try:
+        if mo['Y']:
+            if mo['H'] is None:
+                return datetime.datetime(int(mo['Y']), int(mo['m']), int(mo['d']))
+            f = mo['f']
+            return datetime.datetime(
+                int(mo['Y']), int(mo['m']), int(mo['d']),
+                int(mo['H']), int(mo['M']), int(mo['S']),
+                int(f.ljust(6, '0')) if f else 0,
+            )
+        if mo['sY']:
+            return datetime.datetime(int(mo['sY']), int(mo['sm']), int(mo['sd']))
+        if mo['cY']:
+            return datetime.datetime(int(mo['cY']), int(mo['cm']), int(mo['cd']))
+        if mo['aY']:
+            # Day first, falling back to month first
+            year, a, b = int(mo['aY']), int(mo['a']), int(mo['b'])
+            try:
+                return datetime.datetime(year, b, a)
+            except ValueError:
+                return datetime.datetime(year, a, b)
+        if mo['tY']:
+            month = _MONTH_ABBR_MAP.get(mo['tb'].lower())
+            if month is not None:
+                return datetime.datetime(int(mo['tY']), month, int(mo['td']))
+            return None
+        month = parserinfo.MONTH_MAP.get(mo['bb'].lower())
+        if month is not None:
+            return datetime.datetime(int(mo['bY']), month, int(mo['bd']))
+    except ValueError:
+        pass
+
+    return None
+
+
 def _parse_common_formats(timestr):
     """Try common date formats."""
-    formats = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M:%S.%f",
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%d/%m/%Y",
-        "%m/%d/%Y",
-        "%Y%m%d",
-        "%d-%b-%Y",
-        "%d %b %Y",
-        "%b %d, %Y",
-        "%B %d, %Y",
-    ]
-
-    for fmt in formats:
+    timestr = timestr.strip()
+    result = _match_common_format(timestr)
+    if result is not None:
+        return result
+
+    for fmt in _COMMON_FORMATS:
         try:
-            return datetime.datetime.strptime(timestr.strip(), fmt)
+            return datetime.datetime.strptime(timestr, fmt)
         except ValueError:
             continue
 
@@ -132,7 +220,7 @@ def parse(timestr, parserinfo=None, **kwargs):
 def isoparse(timestr):
     """Parse an ISO 8601 date string."""
     try:
-        return datetime.datetime.fromisoformat(timestr.replace('Z', '+00:00'))
+        return _fromisoformat(timestr)
     except ValueError as e:
         raise ParserError(str(e))
 
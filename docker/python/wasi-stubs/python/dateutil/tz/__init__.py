@@ -9,7 +9,18 @@ ZERO = datetime.timedelta(0)
 
 
 class tzutc(datetime.tzinfo):
-    """UTC timezone."""
+    """UTC timezone.
+
+    tzutc() always returns the same instance.
+    """
+
+    def __new__(cls):
+        # Looked up in cls.__dict__ so a subclass gets its own instance
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
 
     def utcoffset(self, dt):
         return ZERO
@@ -47,14 +58,25 @@ class tzlocal(datetime.tzinfo):
 
 
 class tzoffset(datetime.tzinfo):
-    """Fixed offset timezone."""
-
-    def __init__(self, name, offset):
-        self._name = name
-        if isinstance(offset, datetime.timedelta):
-            self._offset = offset
-        else:
-            self._offset = datetime.timedelta(seconds=offset)
+    """Fixed offset timezone.
+
+    Instances are cached, so repeated tzoffset(name, offset) calls with the
+    same arguments return the same object.
+    """
+
+    _instances = {}
+
+    def __new__(cls, name, offset):
+        if not isinstance(offset, datetime.timedelta):
+            offset = datetime.timedelta(seconds=offset)
+        key = (cls, name, offset)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._name = name
+            instance._offset = offset
+            cls._instances[key] = instance
+        return instance
 
     def utcoffset(self, dt):
         return self._offset
@@ -118,10 +140,8 @@ UTC = tzutc()
 
 def gettz(name=None):
     """Get a timezone by name."""
-    if name is None or name.upper() == "UTC":
-        return UTC
-    # Return a simple offset timezone
-    return tzutc()
+    # There is no zone database: every name, known or not, gives UTC
+    return UTC
 
 
 def datetime_exists(dt, tz=None):
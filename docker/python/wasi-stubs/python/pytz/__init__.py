@@ -11,6 +11,7 @@ ZERO = datetime.timedelta(0)
 
 class BaseTzInfo(datetime.tzinfo):
     """Base class for timezone implementations."""
+    __slots__ = ()
     zone = None
 
     def __repr__(self):
@@ -19,6 +20,7 @@ class BaseTzInfo(datetime.tzinfo):
 
 class _UTC(BaseTzInfo):
     """UTC timezone implementation."""
+    __slots__ = ()
     zone = "UTC"
 
     def utcoffset(self, dt):
@@ -45,6 +47,7 @@ utc = UTC
 
 class _FixedOffset(BaseTzInfo):
     """Fixed offset timezone."""
+    __slots__ = ('_offset', '_name', 'zone')
 
     def __init__(self, offset, name=None):
         if isinstance(offset, datetime.timedelta):
@@ -56,9 +59,8 @@ class _FixedOffset(BaseTzInfo):
 
         if name is None:
             hours, remainder = divmod(abs(total_seconds), 3600)
-            minutes = remainder // 60
-            sign = '-' if total_seconds < 0 else '+'
-            name = f"UTC{sign}{hours:02d}:{minutes:02d}"
+            name = "UTC%s%02d:%02d" % ('-' if total_seconds < 0 else '+',
+                                       hours, remainder // 60)
 
         self.zone = name
         self._name = name
@@ -96,50 +98,61 @@ class NonExistentTimeError(Exception):
     pass
 
 
-# Common timezone names (simplified - no DST support)
-_TIMEZONE_OFFSETS = {
-    "UTC": 0,
-    "GMT": 0,
-    "US/Eastern": -300,
-    "US/Central": -360,
-    "US/Mountain": -420,
-    "US/Pacific": -480,
-    "America/New_York": -300,
-    "America/Chicago": -360,
-    "America/Denver": -420,
-    "America/Los_Angeles": -480,
-    "Europe/London": 0,
-    "Europe/Paris": 60,
-    "Europe/Berlin": 60,
-    "Asia/Tokyo": 540,
-    "Asia/Shanghai": 480,
-    "Australia/Sydney": 600,
+# Common timezone names and UTC offsets in minutes (simplified - no DST support)
+_TIMEZONE_OFFSETS = (
+    ("UTC", 0),
+    ("GMT", 0),
+    ("US/Eastern", -300),
+    ("US/Central", -360),
+    ("US/Mountain", -420),
+    ("US/Pacific", -480),
+    ("America/New_York", -300),
+    ("America/Chicago", -360),
+    ("America/Denver", -420),
+    ("America/Los_Angeles", -480),
+    ("Europe/London", 0),
+    ("Europe/Paris", 60),
+    ("Europe/Berlin", 60),
+    ("Asia/Tokyo", 540),
+    ("Asia/Shanghai", 480),
+    ("Australia/Sydney", 600),
+)
+
+# Every known zone is built up front, so lookups never construct objects
+_timezone_cache = {
+    zone: _FixedOffset(offset, zone) for zone, offset in _TIMEZONE_OFFSETS
 }
-
-_timezone_cache = {"UTC": UTC}
+_timezone_cache["UTC"] = UTC
 
 
 def timezone(zone):
     """Return a timezone object for the given zone name."""
-    if zone in _timezone_cache:
-        return _timezone_cache[zone]
+    tz = _timezone_cache.get(zone)
+    if tz is None:
+        raise UnknownTimeZoneError(zone)
+    return tz
 
-    if zone in _TIMEZONE_OFFSETS:
-        tz = _FixedOffset(_TIMEZONE_OFFSETS[zone], zone)
-        _timezone_cache[zone] = tz
-        return tz
 
-    raise UnknownTimeZoneError(zone)
+_fixed_offset_cache = {}
 
 
 def FixedOffset(offset, name=None):
-    """Return a fixed-offset timezone."""
-    return _FixedOffset(offset, name)
+    """Return a fixed-offset timezone.
+
+    As in pytz, unnamed offsets are cached so repeated calls return the
+    same instance without rebuilding its name.
+    """
+    if name is not None:
+        return _FixedOffset(offset, name)
+    tz = _fixed_offset_cache.get(offset)
+    if tz is None:
+        tz = _fixed_offset_cache[offset] = _FixedOffset(offset)
+    return tz
 
 
 # Common timezone objects
-all_timezones = list(_TIMEZONE_OFFSETS.keys())
-all_timezones_set = set(all_timezones)
+all_timezones = [zone for zone, _ in _TIMEZONE_OFFSETS]
+all_timezones_set = frozenset(all_timezones)
 common_timezones = all_timezones
 common_timezones_set = all_timezones_set
 
@@ -34,29 +34,23 @@ PIPE = -1
 STDOUT = -2
 
 # Stub functions
-def run(*args, **kwargs):
-    """Run command - not supported in WASI."""
-    raise NotImplementedError("subprocess.run is not available in WASI builds")
+def _unsupported(name, doc):
+    """Build a stub that raises NotImplementedError for subprocess.<name>.
 
-def call(*args, **kwargs):
-    """Call command - not supported in WASI."""
-    raise NotImplementedError("subprocess.call is not available in WASI builds")
+    All stubs share one code object, keeping this module's bytecode small.
+    """
+    def stub(*args, **kwargs):
+        raise NotImplementedError(f"subprocess.{name} is not available in WASI builds")
+    stub.__name__ = stub.__qualname__ = name
+    stub.__doc__ = doc
+    return stub
 
-def check_call(*args, **kwargs):
-    """Check call - not supported in WASI."""
-    raise NotImplementedError("subprocess.check_call is not available in WASI builds")
-
-def check_output(*args, **kwargs):
-    """Check output - not supported in WASI."""
-    raise NotImplementedError("subprocess.check_output is not available in WASI builds")
-
-def getoutput(cmd):
-    """Get output - not supported in WASI."""
-    raise NotImplementedError("subprocess.getoutput is not available in WASI builds")
-
-def getstatusoutput(cmd):
-    """Get status and output - not supported in WASI."""
-    raise NotImplementedError("subprocess.getstatusoutput is not available in WASI builds")
+run = _unsupported("run", "Run command - not supported in WASI.")
+call = _unsupported("call", "Call command - not supported in WASI.")
+check_call = _unsupported("check_call", "Check call - not supported in WASI.")
+check_output = _unsupported("check_output", "Check output - not supported in WASI.")
+getoutput = _unsupported("getoutput", "Get output - not supported in WASI.")
+getstatusoutput = _unsupported("getstatusoutput", "Get status and output - not supported in WASI.")
 
 class Popen:
     """Stub Popen class."""
@@ -8,17 +8,18 @@ import wadup
 # Global counter - persists because Python interpreter is reused
 _call_count = 0
 
+# Define output table once: the definition goes out with the first flush
+# and WADUP keeps the schema for later calls
+wadup.define_table("call_counter", [
+    ("call_number", "Int64")
+])
+
 
 def main():
     """Entry point called by WADUP for each file processed."""
     global _call_count
     _call_count += 1
 
-    # Define output table
-    wadup.define_table("call_counter", [
-        ("call_number", "Int64")
-    ])
-
     # Insert the current call count
     wadup.insert_row("call_counter", [_call_count])
 
@@ -1,17 +1,27 @@
 """Test module that imports crashing code at load time."""
 
 import sys
-print("DEBUG: Module loading...", file=sys.stderr, flush=True)
+
+# Set to True to trace how far loading gets before a crash
+_DEBUG = False
+
+
+def _log(msg):
+    if _DEBUG:
+        print(f"DEBUG: {msg}", file=sys.stderr, flush=True)
+
+
+_log("Module loading...")
 
 # Import the large module at load time
-print("DEBUG: About to import large_module...", file=sys.stderr, flush=True)
+_log("About to import large_module...")
 from python_large_file_test import large_module
-print("DEBUG: large_module imported successfully!", file=sys.stderr, flush=True)
+_log("large_module imported successfully!")
 
-print("DEBUG: All imports done!", file=sys.stderr, flush=True)
+_log("All imports done!")
 
 
 def main():
     """Main entry point - just print success."""
-    print("DEBUG: main() called", file=sys.stderr, flush=True)
+    _log("main() called")
     print("SUCCESS!", file=sys.stderr, flush=True)
@@ -7,6 +7,9 @@ the parsed elements to a wadup table.
 import wadup
 from lxml import etree
 
+# Formats one (key, value) attribute pair in a single C call
+_format_attrib = "%s=%s".__mod__
+
 
 def main():
     """Parse XML from input and output elements to a table."""
@@ -26,22 +29,26 @@ def main():
         # Parse XML
         root = etree.fromstring(content)
 
-        # Walk the tree and output elements
-        def walk(elem, depth=0):
+        # Walk the tree in lxml (no Python recursion), tracking depth from
+        # start/end events, and collect one row per element
+        rows = []
+        depth = -1
+        for event, elem in etree.iterwalk(root, events=("start", "end")):
+            if event == "end":
+                depth -= 1
+                continue
+            depth += 1
+
             # Get text content (strip whitespace)
             text = (elem.text or "").strip()
 
             # Format attributes as key=value pairs
-            attribs = ", ".join(f"{k}={v}" for k, v in elem.attrib.items())
-
-            # Insert row
-            wadup.insert_row("xml_elements", [depth, elem.tag, text, attribs])
+            attrib = elem.attrib
+            attribs = ", ".join(map(_format_attrib, attrib.items())) if attrib else ""
 
-            # Recurse into children
-            for child in elem:
-                walk(child, depth + 1)
+            rows.append([depth, elem.tag, text, attribs])
 
-        walk(root)
+        wadup.insert_rows("xml_elements", rows)
 
     except etree.XMLSyntaxError as e:
         # Handle parse errors
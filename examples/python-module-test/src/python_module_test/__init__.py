@@ -24,8 +24,30 @@ C_EXTENSION_MODULES = [
 ]
 
 
+# Import results, computed on the first call. The interpreter is reused
+# across files and imported modules stay in sys.modules, so the results
+# can't change afterwards.
+_import_rows = None
+
+
+def check_imports():
+    """Try importing each module, returning [name, success, error] rows."""
+    rows = []
+    for module_name in C_EXTENSION_MODULES:
+        try:
+            __import__(module_name)
+            rows.append([module_name, 1, ""])
+        except ImportError as e:
+            rows.append([module_name, 0, str(e)])
+        except Exception as e:
+            rows.append([module_name, 0, f"Unexpected error: {str(e)}"])
+    return rows
+
+
 def main():
     """Entry point called by WADUP for each file processed."""
+    global _import_rows
+
     # Create table for import test results
     wadup.define_table("c_extension_imports", [
         ("module_name", "String"),
@@ -33,15 +55,10 @@ def main():
         ("error_message", "String"),
     ])
 
-    # Test each module
-    for module_name in C_EXTENSION_MODULES:
-        try:
-            __import__(module_name)
-            wadup.insert_row("c_extension_imports", [module_name, 1, ""])
-        except ImportError as e:
-            wadup.insert_row("c_extension_imports", [module_name, 0, str(e)])
-        except Exception as e:
-            wadup.insert_row("c_extension_imports", [module_name, 0, f"Unexpected error: {str(e)}"])
+    # Test each module (once per interpreter)
+    if _import_rows is None:
+        _import_rows = check_imports()
+    wadup.insert_rows("c_extension_imports", _import_rows)
 
     # Flush metadata to file for WADUP to process
     wadup.flush()
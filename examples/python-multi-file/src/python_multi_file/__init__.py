@@ -35,19 +35,8 @@ def main():
         ("encoding_slug", "String"),
     ])
 
-    # Insert the analysis results
-    d = analysis.to_dict()
-    wadup.insert_row("file_analysis", [
-        d['total_bytes'],
-        d['line_count'],
-        d['word_count'],
-        d['char_count'],
-        d['human_size'],
-        d['encoding'],
-        d['encoding_confidence'],
-        d['encoding_language'],
-        d['encoding_slug'],
-    ])
+    # Insert the analysis results (fields are in column order)
+    wadup.insert_row("file_analysis", analysis)
 
     # Flush metadata
     wadup.flush()
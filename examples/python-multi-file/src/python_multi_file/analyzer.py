@@ -4,9 +4,9 @@ This module demonstrates:
 1. Code separation across multiple files
 2. Using pure-Python dependencies (chardet, humanize, python-slugify)
 """
-import chardet
+import codecs
+
 import humanize
-from slugify import slugify
 from .models import FileStats, EncodingInfo, FileAnalysis
 
 
@@ -21,7 +21,61 @@ def analyze_content(data: bytes) -> FileAnalysis:
     """
     stats = compute_stats(data)
     encoding_info = detect_encoding(data)
-    return FileAnalysis(stats=stats, encoding_info=encoding_info)
+    return FileAnalysis.combine(stats, encoding_info)
+
+
+# chardet only looks at the first ENCODING_SAMPLE_SIZE bytes, fed in chunks
+ENCODING_SAMPLE_SIZE = 64 * 1024
+ENCODING_CHUNK_SIZE = 8 * 1024
+
+# Non-ASCII text is decoded this many bytes at a time when counting characters
+DECODE_CHUNK_SIZE = 1024 * 1024
+
+# Maps the whitespace `wc -w` splits on to b' ' and every other byte to b'x'
+_WORD_MARKS = bytes(
+    0x20 if b in b' \t\n\r\x0b\x0c' else 0x78 for b in range(256)
+)
+
+
+def count_words(data: bytes) -> int:
+    """Count whitespace-separated words without splitting the data.
+
+    Every word starts either at the beginning of the data or right after
+    whitespace, so after mapping bytes to space/non-space marks the words
+    are the ' x' transitions (plus a leading 'x').
+
+    Args:
+        data: Raw bytes from the file
+
+    Returns:
+        Number of words, as counted by `wc -w`
+    """
+    marks = data.translate(_WORD_MARKS)
+    return marks.count(b' x') + marks.startswith(b'x')
+
+
+def count_utf8_chars(data: bytes) -> int:
+    """Count the characters in UTF-8 data without decoding it all at once.
+
+    Decoding in chunks validates the data while only ever holding one
+    chunk's worth of text, instead of a string the size of the file.
+
+    Args:
+        data: Raw bytes from the file
+
+    Returns:
+        Number of characters
+
+    Raises:
+        UnicodeDecodeError: If the data is not valid UTF-8
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    view = memoryview(data)
+    char_count = 0
+    for start in range(0, len(data), DECODE_CHUNK_SIZE):
+        char_count += len(decoder.decode(view[start:start + DECODE_CHUNK_SIZE]))
+    char_count += len(decoder.decode(b'', final=True))
+    return char_count
 
 
 def compute_stats(data: bytes) -> FileStats:
@@ -43,11 +97,11 @@ def compute_stats(data: bytes) -> FileStats:
     if data and not data.endswith(b'\n'):
         line_count += 1  # Count last line without newline
 
-    # Try to decode as text for word/char counts
+    # Word/char counts only apply to UTF-8 text. ASCII needs no decoding
+    # since every byte is one character.
     try:
-        text = data.decode('utf-8')
-        word_count = len(text.split())
-        char_count = len(text)
+        char_count = total_bytes if data.isascii() else count_utf8_chars(data)
+        word_count = count_words(data)
     except UnicodeDecodeError:
         # Binary file - use byte-based approximations
         word_count = 0
@@ -79,8 +133,19 @@ def detect_encoding(data: bytes) -> EncodingInfo:
             encoding_slug="empty",
         )
 
-    # Use chardet to detect encoding
-    result = chardet.detect(data)
+    # chardet and slugify are only needed here, so callers that just want
+    # stats (and empty inputs) never pay for importing them
+    from chardet.universaldetector import UniversalDetector
+    from slugify import slugify
+
+    # Use chardet to detect encoding from a bounded prefix, stopping as soon
+    # as it is confident
+    detector = UniversalDetector()
+    for start in range(0, min(len(data), ENCODING_SAMPLE_SIZE), ENCODING_CHUNK_SIZE):
+        detector.feed(data[start:start + ENCODING_CHUNK_SIZE])
+        if detector.done:
+            break
+    result = detector.close()
     encoding = result.get('encoding') or "unknown"
 
     # Use python-slugify to create a URL-safe slug from the encoding name
@@ -88,7 +153,7 @@ def detect_encoding(data: bytes) -> EncodingInfo:
 
     return EncodingInfo(
         encoding=encoding,
-        confidence=result.get('confidence', 0.0),
-        language=result.get('language', ''),
-        encoding_slug=encoding_slug,
+        confidence=result.get('confidence') or 0.0,
+        language=result.get('language') or "",
+        encoding_slug=encoding_slug or "unknown",
     )
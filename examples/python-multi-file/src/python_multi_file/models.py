@@ -2,46 +2,50 @@
 
 This module demonstrates multiple files in a project.
 """
+from typing import NamedTuple
 
 
-class FileStats:
+class FileStats(NamedTuple):
     """Statistics about a file."""
 
-    def __init__(self, total_bytes, line_count, word_count, char_count, human_size):
-        self.total_bytes = total_bytes
-        self.line_count = line_count
-        self.word_count = word_count
-        self.char_count = char_count
-        self.human_size = human_size
+    total_bytes: int
+    line_count: int
+    word_count: int
+    char_count: int
+    human_size: str
 
 
-class EncodingInfo:
+class EncodingInfo(NamedTuple):
     """Encoding detection information from chardet."""
 
-    def __init__(self, encoding, confidence, language, encoding_slug):
-        self.encoding = encoding or "unknown"
-        self.confidence = confidence or 0.0
-        self.language = language or ""
-        self.encoding_slug = encoding_slug or "unknown"
+    encoding: str
+    confidence: float
+    language: str
+    encoding_slug: str
 
 
-class FileAnalysis:
-    """Complete analysis of a file."""
+class FileAnalysis(NamedTuple):
+    """Complete analysis of a file.
 
-    def __init__(self, stats, encoding_info):
-        self.stats = stats
-        self.encoding_info = encoding_info
+    Fields are flat and in the same order as the file_analysis table
+    columns, so an instance can be inserted as a row directly.
+    """
+
+    total_bytes: int
+    line_count: int
+    word_count: int
+    char_count: int
+    human_size: str
+    encoding: str
+    encoding_confidence: float
+    encoding_language: str
+    encoding_slug: str
+
+    @classmethod
+    def combine(cls, stats, encoding_info):
+        """Build an analysis from its stats and encoding parts."""
+        return cls(*stats, *encoding_info)
 
     def to_dict(self):
         """Convert analysis to dictionary for WADUP metadata."""
-        return {
-            'total_bytes': self.stats.total_bytes,
-            'line_count': self.stats.line_count,
-            'word_count': self.stats.word_count,
-            'char_count': self.stats.char_count,
-            'human_size': self.stats.human_size,
-            'encoding': self.encoding_info.encoding,
-            'encoding_confidence': self.encoding_info.confidence,
-            'encoding_language': self.encoding_info.language,
-            'encoding_slug': self.encoding_info.encoding_slug,
-        }
+        return self._asdict()
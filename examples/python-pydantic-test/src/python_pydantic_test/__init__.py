@@ -15,36 +15,39 @@ class User(BaseModel):
     email: str
 
 
+# Test users
+_USERS_DATA = (
+    {"name": "Alice", "age": 30, "email": "alice@example.com"},
+    {"name": "Bob", "age": 25, "email": "bob@example.com"},
+    {"name": "Charlie", "age": 35, "email": "charlie@example.com"},
+)
+
+# Define tables once: the interpreter (and this module) is reused across
+# files, and WADUP keeps the schemas after the first flush
+wadup.define_table("users", [
+    ("name", "String"),
+    ("age", "Int64"),
+    ("email", "String"),
+])
+wadup.define_table("info", [
+    ("key", "String"),
+    ("value", "String"),
+])
+
+
 def main():
     """Test pydantic BaseModel functionality."""
-    # Create test users
-    users_data = [
-        {"name": "Alice", "age": 30, "email": "alice@example.com"},
-        {"name": "Bob", "age": 25, "email": "bob@example.com"},
-        {"name": "Charlie", "age": 35, "email": "charlie@example.com"},
-    ]
-
-    # Define tables
-    wadup.define_table("users", [
-        ("name", "String"),
-        ("age", "Int64"),
-        ("email", "String"),
-    ])
-    wadup.define_table("info", [
-        ("key", "String"),
-        ("value", "String"),
-    ])
-
     # Validate and insert users
-    validated_users = []
-    for user_data in users_data:
-        user = User(**user_data)
-        validated_users.append(user)
-        wadup.insert_row("users", [user.name, user.age, user.email])
+    validated_users = [User(**user_data) for user_data in _USERS_DATA]
+    wadup.insert_rows("users", [
+        [user.name, user.age, user.email] for user in validated_users
+    ])
 
     # Record status
-    wadup.insert_row("info", ["status", "success"])
-    wadup.insert_row("info", ["pydantic_core_version", pydantic_core.__version__])
-    wadup.insert_row("info", ["users_validated", str(len(validated_users))])
+    wadup.insert_rows("info", [
+        ["status", "success"],
+        ["pydantic_core_version", pydantic_core.__version__],
+        ["users_validated", str(len(validated_users))],
+    ])
 
     wadup.flush()
@@ -6,10 +6,11 @@
  * It registers C extension modules with PyImport_AppendInittab before Python
  * initialization, which is required because WASI doesn't support dlopen.
  *
- * The bundle.h header (generated during build) contains:
- * - BUNDLE_DATA: The zip file as a byte array
- * - BUNDLE_SIZE: Size of the bundle in bytes
- * - ENTRY_MODULE: Name of the Python module to run
+ * ENTRY_MODULE (name of the Python module to run) is passed on the compiler
+ * command line, so the generated file depends only on the extension set:
+ * projects with the same extensions share it and compile from ccache.
+ * The zip file itself is linked in from bundle.o (assembled from bundle.s
+ * with .incbin), which defines _binary_bundle_zip_start/_end.
  */
 
 #define PY_SSIZE_T_CLEAN
@@ -19,8 +20,11 @@
 #include <sys/stat.h>
 #include <errno.h>
 
-// Generated during build - contains embedded zip bundle
-#include "bundle.h"
+// Embedded zip bundle, provided by bundle.o
+extern const unsigned char _binary_bundle_zip_start[];
+extern const unsigned char _binary_bundle_zip_end[];
+#define BUNDLE_DATA _binary_bundle_zip_start
+#define BUNDLE_SIZE ((size_t)(_binary_bundle_zip_end - _binary_bundle_zip_start))
 
 // WASM export attribute for process() function
 #define WASM_EXPORT __attribute__((visibility("default"))) \
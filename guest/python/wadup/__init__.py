@@ -14,14 +14,37 @@ Example:
     wadup.insert_row("my_table", ["example", 42])
     wadup.flush()
 """
+import itertools
 import json
 import os
 
+
+def _write_file(path, data):
+    """Write bytes to path with raw os calls, skipping Python file objects.
+
+    The host acts on metadata and subcontent files when they are closed,
+    so each file is written in full and closed exactly once.
+    """
+    # 0o666 (less the umask), as open(path, 'w') would create it
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 # Metadata accumulation
 _tables = []
 _rows = []
 _flush_counter = 0
 
+# Rows buffered before insert_row()/insert_rows() flush on their own, to
+# bound memory when a module inserts many rows before calling flush()
+_AUTO_FLUSH_ROWS = 10000
+_metadata_dir_ready = False
+
 
 def define_table(name, columns):
     """Define a metadata table.
@@ -43,6 +66,40 @@ def define_table(name, columns):
     })
 
 
+# Shared tagged values for bools; rows are only read when encoded
+_TRUE = {"Int64": 1}
+_FALSE = {"Int64": 0}
+
+
+def _typed_value(v):
+    """Convert a Python value to a tagged metadata value."""
+    if isinstance(v, bool):
+        # bool must be checked before int since bool is a subclass of int
+        return _TRUE if v else _FALSE
+    elif isinstance(v, int):
+        return {"Int64": v}
+    elif isinstance(v, float):
+        return {"Float64": v}
+    else:
+        return {"String": str(v)}
+
+
+# Converters for exact built-in types; anything else (including subclasses
+# such as IntEnum) goes through _typed_value
+_VALUE_CONVERTERS = {
+    bool: lambda v: _TRUE if v else _FALSE,
+    int: lambda v: {"Int64": v},
+    float: lambda v: {"Float64": v},
+    str: lambda v: {"String": v},
+}
+
+
+def _typed_values(values):
+    """Convert a row's Python values to tagged metadata values."""
+    get = _VALUE_CONVERTERS.get
+    return [get(type(v), _typed_value)(v) for v in values]
+
+
 def insert_row(table_name, values):
     """Insert a row into a previously defined table.
 
@@ -53,18 +110,38 @@ def insert_row(table_name, values):
     Example:
         wadup.insert_row("files", ["readme.txt", 1024])
     """
-    typed = []
-    for v in values:
-        if isinstance(v, bool):
-            # bool must be checked before int since bool is a subclass of int
-            typed.append({"Int64": 1 if v else 0})
-        elif isinstance(v, int):
-            typed.append({"Int64": v})
-        elif isinstance(v, float):
-            typed.append({"Float64": v})
-        else:
-            typed.append({"String": str(v)})
-    _rows.append({"table_name": table_name, "values": typed})
+    _rows.append({"table_name": table_name, "values": _typed_values(values)})
+    if len(_rows) >= _AUTO_FLUSH_ROWS:
+        flush()
+
+
+def insert_rows(table_name, rows):
+    """Insert several rows into a previously defined table.
+
+    Equivalent to calling insert_row() for each row, without the per-call
+    overhead.
+
+    Args:
+        table_name: Name of the target table
+        rows: Iterable of value lists (int, float, or str)
+
+    Example:
+        wadup.insert_rows("files", [
+            ["readme.txt", 1024],
+            ["setup.py", 2048],
+        ])
+    """
+    rows = iter(rows)
+    while True:
+        # Take only what fits before the auto-flush threshold, so a large
+        # batch is flushed in chunks instead of buffered whole
+        _rows.extend(
+            {"table_name": table_name, "values": _typed_values(values)}
+            for values in itertools.islice(rows, _AUTO_FLUSH_ROWS - len(_rows))
+        )
+        if len(_rows) < _AUTO_FLUSH_ROWS:
+            break
+        flush()
 
 
 def flush():
@@ -73,22 +150,27 @@ def flush():
     Writes all accumulated table definitions and rows to a JSON file
     in /metadata/output_N.json. The file is processed by WADUP when closed.
 
-    This function clears the accumulated data after writing.
+    This function clears the accumulated data after writing. It is also
+    called automatically once 10000 rows are buffered.
     """
-    global _flush_counter, _tables, _rows
+    global _flush_counter, _tables, _rows, _metadata_dir_ready
 
     if not _tables and not _rows:
         return
 
-    os.makedirs("/metadata", exist_ok=True)
+    if not _metadata_dir_ready:
+        os.makedirs("/metadata", exist_ok=True)
+        _metadata_dir_ready = True
 
     metadata = {
         "tables": _tables,
         "rows": _rows
     }
 
-    with open(f"/metadata/output_{_flush_counter}.json", "w") as f:
-        json.dump(metadata, f)
+    # json.dumps() encodes in one call to the C encoder; json.dump() would
+    # write every token through a separate f.write()
+    _write_file(f"/metadata/output_{_flush_counter}.json",
+                json.dumps(metadata).encode())
 
     _flush_counter += 1
     _tables = []
@@ -97,6 +179,7 @@ def flush():
 
 # Sub-content emission
 _subcontent_counter = 0
+_subcontent_dir_ready = False
 
 
 def emit_bytes(data, filename):
@@ -106,7 +189,8 @@ def emit_bytes(data, filename):
     a zip archive). WADUP will recursively analyze the emitted content.
 
     Args:
-        data: Raw bytes to emit (bytes object)
+        data: Raw bytes to emit (bytes, bytearray, memoryview or any other
+              bytes-like object; written as-is, without copying)
         filename: Suggested filename for the content (string)
 
     Example:
@@ -115,16 +199,17 @@ def emit_bytes(data, filename):
             for name in zf.namelist():
                 wadup.emit_bytes(zf.read(name), name)
     """
-    global _subcontent_counter
+    global _subcontent_counter, _subcontent_dir_ready
     n = _subcontent_counter
     _subcontent_counter += 1
 
-    os.makedirs("/subcontent", exist_ok=True)
+    if not _subcontent_dir_ready:
+        os.makedirs("/subcontent", exist_ok=True)
+        _subcontent_dir_ready = True
 
     # Write data file
-    with open(f"/subcontent/data_{n}.bin", "wb") as f:
-        f.write(data)
+    _write_file(f"/subcontent/data_{n}.bin", data)
 
     # Write metadata file (triggers processing on close)
-    with open(f"/subcontent/metadata_{n}.json", "w") as f:
-        json.dump({"filename": filename}, f)
+    _write_file(f"/subcontent/metadata_{n}.json",
+                json.dumps({"filename": filename}).encode())
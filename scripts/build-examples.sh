@@ -157,6 +157,7 @@ build_python_module() {
     docker run --rm \
         -v "$src_dir:/build/src:ro" \
         -v "$target_dir:/build/output:rw" \
+        -v wadup-python-build-cache:/build/.cache \
         wadup-build-python:latest
 
     # Docker outputs module.wasm, rename to expected name
@@ -0,0 +1,37 @@
+"""Shared setup for the Python tests.
+
+Makes the guest wadup library, the Python build's extension registry and
+the WASI stub packages importable straight from the source tree.
+
+Run from the repository root with:
+
+    python -m pytest tests/python
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+WASI_STUBS = ROOT / "docker" / "python" / "wasi-stubs" / "python"
+
+sys.path.insert(0, str(ROOT / "guest" / "python"))
+sys.path.insert(0, str(ROOT / "docker" / "python"))
+
+
+def load_stub_package(name: str) -> None:
+    """Import a WASI stub package under its real name.
+
+    The stubs directory also holds stand-ins for stdlib modules (subprocess,
+    asyncio, ...), so it is never put on sys.path; only the named package is
+    loaded, replacing any installed package of the same name.
+    """
+    pkg_dir = WASI_STUBS / name
+    spec = importlib.util.spec_from_file_location(
+        name, pkg_dir / "__init__.py", submodule_search_locations=[str(pkg_dir)],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+
+load_stub_package("dateutil")
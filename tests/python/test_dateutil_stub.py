@@ -0,0 +1,183 @@
+"""Tests for the dateutil WASI stub."""
+import datetime
+
+import pytest
+
+from dateutil import parser, tz
+
+UTC = datetime.timezone.utc
+
+
+# The parser before the single-regex fast path: ISO first, then each
+# strptime format in turn. The fast path must give the same results.
+_BASELINE_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d",
+    "%Y/%m/%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%Y%m%d",
+    "%d-%b-%Y",
+    "%d %b %Y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+]
+
+
+def baseline_common_formats(timestr):
+    for fmt in _BASELINE_FORMATS:
+        try:
+            return datetime.datetime.strptime(timestr.strip(), fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def baseline_parse(timestr):
+    timestr = timestr.strip()
+    try:
+        return datetime.datetime.fromisoformat(timestr.replace('Z', '+00:00'))
+    except ValueError:
+        pass
+    try:
+        return datetime.datetime.combine(datetime.date.fromisoformat(timestr), datetime.time())
+    except ValueError:
+        pass
+    return baseline_common_formats(timestr)
+
+
+# Canonical spellings, handled by the fast path
+FAST_PATH_CASES = [
+    ("2024-01-05 10:11:12", datetime.datetime(2024, 1, 5, 10, 11, 12)),
+    ("2024-01-05 10:11:12.5", datetime.datetime(2024, 1, 5, 10, 11, 12, 500000)),
+    ("2024-01-05 10:11:12.123456", datetime.datetime(2024, 1, 5, 10, 11, 12, 123456)),
+    ("2024-01-05", datetime.datetime(2024, 1, 5)),
+    ("2024/01/05", datetime.datetime(2024, 1, 5)),
+    ("20240105", datetime.datetime(2024, 1, 5)),
+    ("05/01/2024", datetime.datetime(2024, 1, 5)),   # day first
+    ("01/13/2024", datetime.datetime(2024, 1, 13)),  # month first when day first is invalid
+    ("05-Jan-2024", datetime.datetime(2024, 1, 5)),
+    ("5 jan 2024", datetime.datetime(2024, 1, 5)),
+    ("Jan 05, 2024", datetime.datetime(2024, 1, 5)),
+    ("JANUARY 5, 2024", datetime.datetime(2024, 1, 5)),
+    ("May 31, 2024", datetime.datetime(2024, 5, 31)),
+    ("  2024-01-05  ", datetime.datetime(2024, 1, 5)),
+]
+
+# Valid for strptime but not canonical: must fall through to the slow path
+SLOW_PATH_CASES = [
+    ("2024-1-5", datetime.datetime(2024, 1, 5)),
+    ("2024-01-05  10:11:12", datetime.datetime(2024, 1, 5, 10, 11, 12)),
+    ("2024-01-05 1:2:3", datetime.datetime(2024, 1, 5, 1, 2, 3)),
+    ("5/1/2024", datetime.datetime(2024, 1, 5)),
+    ("Jan  5, 2024", datetime.datetime(2024, 1, 5)),
+]
+
+# Not a common format at all, or an impossible date
+NO_MATCH_CASES = [
+    "05 January 2024",  # %b takes abbreviations only
+    "Sept 5, 2024",
+    "2024/01/05 10:11:12",
+    "2024-02-30",
+    "31/02/2024",
+    "2024-01-05 24:00:00",
+    "20241315",
+    "١٢/01/2024",  # Arabic-Indic digits
+    "yesterday",
+]
+
+
+@pytest.mark.parametrize("timestr, expected", FAST_PATH_CASES)
+def test_fast_path_matches_baseline(timestr, expected):
+    assert parser._match_common_format(timestr.strip()) == expected
+    assert parser._parse_common_formats(timestr) == expected
+    assert baseline_common_formats(timestr) == expected
+
+
+@pytest.mark.parametrize("timestr, expected", SLOW_PATH_CASES)
+def test_non_canonical_input_falls_through_to_strptime(timestr, expected):
+    assert parser._match_common_format(timestr.strip()) is None
+    assert parser._parse_common_formats(timestr) == expected
+    assert baseline_common_formats(timestr) == expected
+
+
+@pytest.mark.parametrize("timestr", NO_MATCH_CASES + [
+    "2024-01-05 10:11:12.1234567",  # only the ISO path takes 7 digits
+])
+def test_unparseable_common_formats(timestr):
+    assert parser._parse_common_formats(timestr) is None
+    assert baseline_common_formats(timestr) is None
+
+
+@pytest.mark.parametrize("timestr, expected", [
+    ("2024-01-05T10:11:12Z", datetime.datetime(2024, 1, 5, 10, 11, 12, tzinfo=UTC)),
+    ("2024-01-05T10:11:12+02:00",
+     datetime.datetime(2024, 1, 5, 10, 11, 12, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))),
+    ("2024-01-05 10:11:12.250-05:30",
+     datetime.datetime(2024, 1, 5, 10, 11, 12, 250000,
+                       tzinfo=datetime.timezone(-datetime.timedelta(hours=5, minutes=30)))),
+    ("2024-01-05T10:11:12.123456", datetime.datetime(2024, 1, 5, 10, 11, 12, 123456)),
+    ("2024-01-05", datetime.datetime(2024, 1, 5)),
+    *FAST_PATH_CASES,
+    *SLOW_PATH_CASES,
+])
+def test_parse_matches_baseline(timestr, expected):
+    result = parser.parse(timestr)
+    assert result == expected
+    assert result.tzinfo == expected.tzinfo
+    assert baseline_parse(timestr) == result
+
+
+@pytest.mark.parametrize("timestr", NO_MATCH_CASES + ["", "   "])
+def test_parse_rejects_unknown_formats(timestr):
+    assert baseline_parse(timestr) is None
+    with pytest.raises(parser.ParserError):
+        parser.parse(timestr)
+
+
+def test_isoparse():
+    assert parser.isoparse("2024-01-05T10:11:12Z") == datetime.datetime(2024, 1, 5, 10, 11, 12, tzinfo=UTC)
+    with pytest.raises(parser.ParserError):
+        parser.isoparse("05/01/2024")
+
+
+@pytest.mark.parametrize("timestr", ["2024-01-05Z", "2024-01-05T10:11Z"])
+def test_z_suffix_matches_baseline(timestr):
+    # fromisoformat never accepts a 'Z' straight after a date, and before
+    # Python 3.11 not after a time either: both need the 'Z' rewritten
+    expected = baseline_parse(timestr)
+    assert expected is not None
+    for result in (parser.parse(timestr), parser.isoparse(timestr)):
+        assert result == expected
+        assert result.tzinfo == expected.tzinfo
+
+
+def test_tzutc_is_a_cached_tzinfo():
+    utc = tz.tzutc()
+    assert utc is tz.tzutc() is tz.UTC
+    assert type(utc) is tz.tzutc
+    assert repr(utc) == "tzutc()"
+    assert utc.utcoffset(None) == utc.dst(None) == datetime.timedelta(0)
+    assert utc.tzname(None) == "UTC"
+    assert not isinstance(utc, tz.tzoffset)
+    assert tz.gettz("Mars/Olympus_Mons") is utc
+
+
+def test_tzoffset_is_a_cached_tzinfo():
+    est = tz.tzoffset("EST", -18000)
+    assert est is tz.tzoffset("EST", datetime.timedelta(hours=-5))
+    assert est is not tz.tzoffset("XST", -18000)
+    assert type(est) is tz.tzoffset
+    assert not isinstance(est, tz.tzutc)
+    assert repr(est) == "tzoffset('EST', -18000.0)"
+    assert est.utcoffset(None) == datetime.timedelta(hours=-5)
+    assert est.dst(None) == datetime.timedelta(0)
+    assert est.tzname(None) == "EST"
+    dt = datetime.datetime(2024, 1, 5, 12, tzinfo=est)
+    assert dt.astimezone(UTC) == datetime.datetime(2024, 1, 5, 17, tzinfo=UTC)
+
+
+def test_tzoffset_accepts_offsets_of_a_day_or_more():
+    # Like dateutil, construction doesn't validate the offset
+    assert tz.tzoffset(None, 86400).utcoffset(None) == datetime.timedelta(days=1)
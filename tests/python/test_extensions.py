@@ -0,0 +1,81 @@
+"""Tests for the Python build's C extension registry."""
+import pytest
+
+import extensions
+from extensions import ExtensionSpec
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    extensions.clear_cache()
+    yield
+    extensions.clear_cache()
+
+
+def test_default_selects_every_extension_in_registry_order():
+    assert extensions.get_all_modules() == (
+        ("_pydantic_core", "PyInit__pydantic_core"),
+        ("lxml.etree", "PyInit_etree"),
+    )
+    assert extensions.get_all_libraries() == (
+        extensions.EXTENSIONS["pydantic"].libraries + extensions.EXTENSIONS["lxml"].libraries
+    )
+    assert extensions.get_all_python_files() == ("wasi-pydantic/python/typing_extensions.py",)
+
+
+@pytest.mark.parametrize("names", [["lxml", "pydantic"], ("pydantic", "lxml"), {"lxml", "pydantic"}])
+def test_listing_every_extension_matches_the_default(names):
+    # Selection order and container type don't matter: results follow the registry
+    assert extensions.get_all_python_dirs(names) == extensions.get_all_python_dirs()
+
+
+def test_subset():
+    lxml = extensions.EXTENSIONS["lxml"]
+    assert extensions.get_all_modules(["lxml"]) == lxml.modules
+    assert extensions.get_all_libraries(["lxml"]) == lxml.libraries
+    assert extensions.get_all_python_dirs(["lxml"]) == ("wasi-lxml/python/lxml",)
+    assert extensions.get_all_python_files(["lxml"]) == ()
+    assert extensions.get_validation_files(["lxml"]) == lxml.validation
+
+
+def test_empty_selection():
+    assert extensions.get_all_modules([]) == ()
+    assert extensions.get_all_libraries([]) == ()
+
+
+def test_unknown_extension():
+    with pytest.raises(ValueError, match="Unknown extensions: numpy, scipy"):
+        extensions.get_all_modules(["scipy", "lxml", "numpy"])
+
+
+def test_results_are_tuples():
+    for get in (extensions.get_all_modules, extensions.get_all_libraries,
+                extensions.get_all_python_dirs, extensions.get_all_python_files,
+                extensions.get_validation_files):
+        assert isinstance(get(), tuple)
+        assert isinstance(get(["pydantic"]), tuple)
+
+
+def test_selections_are_resolved_once():
+    first = extensions.get_all_libraries(["lxml"])
+    assert extensions.get_all_libraries(("lxml",)) is first
+    assert extensions.get_all_libraries({"lxml"}) is first
+
+    extensions.clear_cache()
+    fresh = extensions.get_all_libraries(["lxml"])
+    assert fresh is not first
+    assert fresh == first
+
+
+def test_clear_cache_picks_up_registry_changes(monkeypatch):
+    assert ("extra", "PyInit_extra") not in extensions.get_all_modules()
+
+    monkeypatch.setitem(extensions.EXTENSIONS, "extra", ExtensionSpec(
+        modules=(("extra", "PyInit_extra"),),
+        libraries=("wasi-extra/lib/libextra.a",),
+    ))
+    assert ("extra", "PyInit_extra") not in extensions.get_all_modules()
+
+    extensions.clear_cache()
+    assert extensions.get_all_modules()[-1] == ("extra", "PyInit_extra")
+    assert extensions.get_all_libraries(["extra"]) == ("wasi-extra/lib/libextra.a",)
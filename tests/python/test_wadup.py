@@ -0,0 +1,169 @@
+"""Tests for the guest-side wadup library."""
+import enum
+import json
+import os
+import stat
+
+import pytest
+
+import wadup
+
+
+@pytest.fixture
+def written(monkeypatch):
+    """Give each test empty buffers and capture flushed metadata files."""
+    monkeypatch.setattr(wadup, "_tables", [])
+    monkeypatch.setattr(wadup, "_rows", [])
+    monkeypatch.setattr(wadup, "_flush_counter", 0)
+    monkeypatch.setattr(wadup, "_metadata_dir_ready", True)
+    files = []
+    monkeypatch.setattr(wadup, "_write_file", lambda path, data: files.append((path, json.loads(bytes(data)))))
+    return files
+
+
+def test_write_file_creates_files_like_open(tmp_path):
+    old_umask = os.umask(0o022)
+    try:
+        wadup._write_file(tmp_path / "raw", memoryview(b"data"))
+        with open(tmp_path / "builtin", "w") as f:
+            f.write("data")
+    finally:
+        os.umask(old_umask)
+
+    assert (tmp_path / "raw").read_bytes() == b"data"
+    assert stat.S_IMODE((tmp_path / "raw").stat().st_mode) == 0o644
+    assert (tmp_path / "raw").stat().st_mode == (tmp_path / "builtin").stat().st_mode
+
+
+class Color(enum.IntEnum):
+    RED = 3
+
+
+class Label(str):
+    pass
+
+
+class Ratio(float):
+    pass
+
+
+class Thing:
+    def __str__(self):
+        return "thing"
+
+
+@pytest.mark.parametrize("value, expected", [
+    (True, {"Int64": 1}),
+    (False, {"Int64": 0}),
+    (0, {"Int64": 0}),
+    (-42, {"Int64": -42}),
+    (2**40, {"Int64": 2**40}),
+    (1.5, {"Float64": 1.5}),
+    ("text", {"String": "text"}),
+    ("", {"String": ""}),
+    # Subclasses don't match the exact-type converters and take the
+    # isinstance path instead
+    (Color.RED, {"Int64": 3}),
+    (Label("name"), {"String": "name"}),
+    (Ratio(0.25), {"Float64": 0.25}),
+    # Everything else is stored as its str()
+    (None, {"String": "None"}),
+    (b"ab", {"String": "b'ab'"}),
+    (bytearray(b"ab"), {"String": "bytearray(b'ab')"}),
+    (Thing(), {"String": "thing"}),
+])
+def test_typed_values(value, expected):
+    (typed,) = wadup._typed_values([value])
+    # Compare the encoded form: IntEnum members encode as plain ints
+    assert json.dumps(typed) == json.dumps(expected)
+
+
+def test_bool_is_not_stored_as_json_boolean():
+    assert json.dumps(wadup._typed_values([True, False])) == '[{"Int64": 1}, {"Int64": 0}]'
+
+
+def test_memoryview_is_stored_as_its_str():
+    view = memoryview(b"ab")
+    assert wadup._typed_values([view]) == [{"String": str(view)}]
+
+
+def test_type_dispatch_matches_isinstance_chain():
+    values = [True, 1, 1.5, "s", None, b"b", Color.RED, Label("l"), Ratio(0.5), Thing()]
+    assert wadup._typed_values(values) == [wadup._typed_value(v) for v in values]
+
+
+def test_insert_rows_matches_insert_row(written, monkeypatch):
+    rows = [["a.txt", 1, 0.5], ["b.txt", 2, 1.5], ["c.txt", True, None]]
+
+    wadup.insert_rows("files", rows)
+    batched = wadup._rows
+    monkeypatch.setattr(wadup, "_rows", [])
+    for row in rows:
+        wadup.insert_row("files", row)
+
+    assert batched == wadup._rows
+    assert len(batched) == 3
+
+
+def test_insert_rows_accepts_any_iterable(written):
+    wadup.insert_rows("squares", ([i, i * i] for i in range(3)))
+    wadup.insert_rows("squares", [])
+
+    assert [row["values"] for row in wadup._rows] == [
+        [{"Int64": i}, {"Int64": i * i}] for i in range(3)
+    ]
+
+
+def test_flush_writes_tables_and_rows(written):
+    wadup.define_table("files", [("name", "String"), ("size", "Int64")])
+    wadup.insert_rows("files", [["a.txt", 10], ["b.txt", 20]])
+    wadup.flush()
+    wadup.flush()  # nothing buffered: no second file
+
+    assert written == [("/metadata/output_0.json", {
+        "tables": [{"name": "files", "columns": [
+            {"name": "name", "data_type": "String"},
+            {"name": "size", "data_type": "Int64"},
+        ]}],
+        "rows": [
+            {"table_name": "files", "values": [{"String": "a.txt"}, {"Int64": 10}]},
+            {"table_name": "files", "values": [{"String": "b.txt"}, {"Int64": 20}]},
+        ],
+    })]
+    assert wadup._tables == [] and wadup._rows == []
+
+
+def test_insert_row_flushes_at_threshold(written, monkeypatch):
+    monkeypatch.setattr(wadup, "_AUTO_FLUSH_ROWS", 3)
+    for i in range(2):
+        wadup.insert_row("t", [i])
+    assert written == []
+
+    wadup.insert_row("t", [2])
+    assert [path for path, _ in written] == ["/metadata/output_0.json"]
+    assert len(written[0][1]["rows"]) == 3
+    assert wadup._rows == []
+
+
+def test_insert_rows_flushes_large_batches_in_chunks(written):
+    wadup.insert_row("t", ["first"])
+    wadup.insert_rows("t", ([i] for i in range(25000)))
+
+    assert [len(metadata["rows"]) for _, metadata in written] == [10000, 10000]
+    assert written[0][1]["rows"][0]["values"] == [{"String": "first"}]
+    assert written[1][1]["rows"][0]["values"] == [{"Int64": 9999}]
+    assert len(wadup._rows) == 5001
+
+    wadup.flush()
+    assert [path for path, _ in written] == [f"/metadata/output_{i}.json" for i in range(3)]
+    assert len(written[2][1]["rows"]) == 5001
+    assert written[2][1]["rows"][-1]["values"] == [{"Int64": 24999}]
+
+
+def test_insert_rows_filling_the_buffer_exactly(written, monkeypatch):
+    monkeypatch.setattr(wadup, "_AUTO_FLUSH_ROWS", 3)
+    wadup.insert_rows("t", [[1], [2], [3]])
+    assert len(written) == 1 and wadup._rows == []
+
+    wadup.flush()
+    assert len(written) == 1
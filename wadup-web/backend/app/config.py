@@ -1,6 +1,7 @@
 """Application configuration."""
+from functools import cached_property
 from pathlib import Path
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Base directory for the web app
 BASE_DIR = Path(__file__).parent.parent.parent.resolve()
@@ -38,12 +39,20 @@ class Settings(BaseSettings):
     go_build_image: str = "wadup-build-go:latest"
     python_build_image: str = "wadup-build-python:latest"
 
+    # Docker volume that persists compiled bytecode and ccache objects
+    # between Python builds
+    python_build_cache_volume: str = "wadup-python-build-cache"
+
     # Test runner image
     test_runner_image: str = "wadup-test-runner:latest"
 
-    class Config:
-        env_prefix = "WADUP_"
-        env_file = ".env"
+    # Frozen: settings are read once at startup and shared by every request
+    model_config = SettingsConfigDict(env_prefix="WADUP_", env_file=".env", frozen=True)
+
+    @cached_property
+    def resolved_storage_root(self) -> Path:
+        """storage_root with symlinks resolved (settings are frozen, so once)."""
+        return self.storage_root.resolve()
 
     def get_host_path(self, container_path: Path) -> Path:
         """Convert a container storage path to a host path for Docker volume mounts.
@@ -58,11 +67,10 @@ class Settings(BaseSettings):
 
         # Make paths absolute and resolve symlinks
         container_path = container_path.resolve()
-        storage_root = self.storage_root.resolve()
 
         # Check if the path is under storage_root
         try:
-            relative = container_path.relative_to(storage_root)
+            relative = container_path.relative_to(self.resolved_storage_root)
             return self.host_storage_root / relative
         except ValueError:
             # Path is not under storage_root, return as-is
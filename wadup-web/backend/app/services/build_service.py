@@ -67,15 +67,20 @@ class BuildService:
             image = self.get_image_for_language(language)
             self._add_log(module_id, f"Starting build with image: {image}")
 
+            volumes = {
+                str(host_source_path): {"bind": "/build/src", "mode": "ro"},
+                str(host_artifact_path): {"bind": "/build/output", "mode": "rw"},
+            }
+            if language == Language.PYTHON:
+                # Reuse compiled bytecode and objects from previous builds
+                volumes[settings.python_build_cache_volume] = {"bind": "/build/.cache", "mode": "rw"}
+
             # Run Docker container
             try:
                 container = self.docker_client.containers.run(
                     image,
                     detach=True,
-                    volumes={
-                        str(host_source_path): {"bind": "/build/src", "mode": "ro"},
-                        str(host_artifact_path): {"bind": "/build/output", "mode": "rw"},
-                    },
+                    volumes=volumes,
                     user="builder",
                     working_dir="/build/src",
                     remove=False,